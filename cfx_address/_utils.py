@@ -1,4 +1,5 @@
 # utils do not rely on other modules are defined here to avoid recursive import
+from functools import lru_cache
 from typing import (
     Any,
     Union,
@@ -16,7 +17,7 @@ from cfx_utils.exceptions import (
     InvalidHexAddress, 
     
 )
-from eth_utils.crypto import (
+from eth_hash.auto import (
     keccak
 )
 from eth_utils.address import (
@@ -37,9 +38,12 @@ def public_key_to_cfx_hex(public_key: Union[str, bytes]) -> HexAddress:
     >>> public_key_to_cfx_hex("0xdacdaeba8e391e7649d3ac4b5329ca0e202d38facd928d88b5f729b89a497e43cc4ad3816fcfdb241497b3b43862afb4c899bc284bf60feca4ee66ff868d1feb")
     '0x152d251c36aec31072b90a85b95bf9435b07edb8'
     """    
-    public_key = HexBytes(public_key)
+    # bytes are hashed as is, other representations are converted by HexBytes
+    if not isinstance(public_key, bytes):
+        public_key = HexBytes(public_key)
     # only EOA has a corresponding public key
-    address = "0x1" + keccak(public_key).hex()[-39:]
+    # the last 20 bytes of the digest are hex encoded, replacing the first hex digit with 1
+    address = "0x1" + keccak(public_key)[-20:].hex()[1:]
     return cast(HexAddress, address)
 
 def eth_eoa_address_to_cfx_hex(eoa_address: str) -> HexAddress:
@@ -60,6 +64,21 @@ def eth_eoa_address_to_cfx_hex(eoa_address: str) -> HexAddress:
     validate_hex_address(eoa_address)
     return '0x1' + eoa_address.lower()[3:] # type: ignore
 
+def hex_address_bytes(hex_address: str) -> bytes:
+    """
+    Convert a hex address (with or without "0x" prefix) to bytes. The address is not validated.
+
+    :param str hex_address: hex address to convert
+    :return bytes: the bytes representation of the address
+    
+    >>> hex_address_bytes("0x1ecde7223747601823f7535d7968ba98b4881e09").hex()
+    '1ecde7223747601823f7535d7968ba98b4881e09'
+    """
+    # bytes.fromhex is much cheaper than constructing a HexBytes
+    if hex_address.startswith(("0x", "0X")):
+        return bytes.fromhex(hex_address[2:])
+    return bytes.fromhex(hex_address)
+
 def validate_network_id(network_id: Any) -> Literal[True]:
     """
     Checks if the given value is a positive integer.
@@ -69,11 +88,26 @@ def validate_network_id(network_id: Any) -> Literal[True]:
     :raises InvalidHexAddress: raised if not valid
     :return Literal[True]: returns True if valid
     """
-    if isinstance(network_id, int) and network_id > 0:
+    # plain ints take a pointer comparison instead of an isinstance check
+    if type(network_id) is int and network_id > 0:
+        return True
+    # other int subclasses are accepted except bool, which is not a valid network id
+    if isinstance(network_id, int) and not isinstance(network_id, bool) and network_id > 0:
         return True
     raise InvalidNetworkId("Expected network_id to be a positive integer. "
                      f"Receives {network_id} of type {type(network_id)}")
 
+@lru_cache(maxsize=4096)
+def is_hex_address_cached(value: str) -> bool:
+    """
+    :func:`eth_utils.address.is_hex_address` with results cached, as the same addresses are usually checked repeatedly.
+    The value should be a str (or at least hashable), the cache can be cleared by ``is_hex_address_cached.cache_clear()``
+
+    >>> is_hex_address_cached("0x1ecde7223747601823f7535d7968ba98b4881e09")
+    True
+    """
+    return is_hex_address(value)
+
 def validate_hex_address(value: Any) -> Literal[True]:
     """
     Checks if the given string of text type is an address in hexadecimal encoded form.
@@ -82,7 +116,8 @@ def validate_hex_address(value: Any) -> Literal[True]:
     :raises InvalidHexAddress: raised if not valid
     :return Literal[True]: returns True if valid
     """
-    if not is_hex_address(value):
+    # only str values can be hex addresses, which also keeps unhashable values out of the cache
+    if not (isinstance(value, str) and is_hex_address_cached(value)):
         raise InvalidHexAddress("Expected a hex40 address. "
                                 f"Receives {value}")
     return True
@@ -1,6 +1,9 @@
 from typing import (
     Any,
+    Dict,
+    List,
     Optional,
+    Tuple,
     Type, 
     Union,
     cast,
@@ -8,32 +11,31 @@ from typing import (
     TYPE_CHECKING
 )
 import warnings
+from functools import lru_cache
 from typing_extensions import (
     Literal,
     get_args,
 )
 
-import sys
-
-from hexbytes import (
-    HexBytes
-)
 from eth_typing.evm import (
     ChecksumAddress,
     HexAddress,
 )
-from eth_utils.crypto import (
+# eth_utils.crypto.keccak converts its argument with to_bytes and copies the digest,
+# the hash backend is used directly as the argument is always bytes
+from eth_hash.auto import (
     keccak
 )
 from eth_utils.address import (
     to_checksum_address,
-    is_hex_address
 )
 
 from cfx_address import (
     base32
 )
 from cfx_address._utils import (
+    hex_address_bytes,
+    is_hex_address_cached,
     validate_hex_address,
     validate_network_id
 )
@@ -67,7 +69,7 @@ from cfx_address.consts import (
     CHECKSUM_TEMPLATE,
 )
 from cfx_address._utils import (
-    public_key_to_cfx_hex
+    public_key_to_cfx_hex,
 )
 
 if TYPE_CHECKING:
@@ -76,10 +78,47 @@ if TYPE_CHECKING:
 
 default = object()
 
-if sys.version_info >= (3, 8):
-    from functools import cached_property
-else:
-    from cached_property import cached_property
+# generators of the BCH code used by the CIP-37 checksum
+_POLY_MOD_GENERATORS = (0x98f2bc8e61, 0x79b76d99e2, 0xf33e5fb3c4, 0xae2eabe2a8, 0x1e4f43e470)
+
+def _build_poly_mod_table() -> Tuple[int, ...]:
+    # the reduction term only depends on the 5 bits shifted out of c,
+    # so the xor of the selected generators can be looked up instead of computed per byte
+    table: List[int] = []
+    for i in range(32):
+        x = 0
+        for k, generator in enumerate(_POLY_MOD_GENERATORS):
+            if (i >> k) & 1:
+                x ^= generator
+        table.append(x)
+    return tuple(table)
+
+_POLY_MOD_TABLE = _build_poly_mod_table()
+
+def _build_poly_mod_pair_table() -> Tuple[int, ...]:
+    # the reduction is linear, so the terms of two consecutive words only depend on the 10 bits shifted out of c
+    # and can be looked up at once, which halves the iterations of the poly_mod loop
+    def step(c: int) -> int:
+        return ((c & 0x07ffffffff) << 5) ^ _POLY_MOD_TABLE[c >> 35]
+    return tuple(step(step(i << 30)) for i in range(1024))
+
+_POLY_MOD_PAIR_TABLE = _build_poly_mod_pair_table()
+
+_ADDRESS_TYPES = frozenset(get_args(AddressType))
+# the optional "type.*" field of verbose addresses for each address type
+_TYPE_FIELDS: Dict[AddressType, str] = {address_type: f"{TYPE}.{address_type}" for address_type in get_args(AddressType)}
+
+# encoded zero addresses keyed by (network_id, verbose)
+_ZERO_ADDRESS_CACHE: Dict[Tuple[int, bool], str] = {}
+
+# maps each byte to its low 5 bits, used to convert the network prefix to words
+_LOW_5_BITS_TABLE = bytes(i & 0x1f for i in range(256))
+
+# address type indexed by the high nibble of the first address byte
+_VALID_ADDRESS_TYPE_BY_HIGH_NIBBLE: Dict[int, AddressType] = {0x0: TYPE_BUILTIN, 0x1: TYPE_USER, 0x8: TYPE_CONTRACT}
+_ADDRESS_TYPE_BY_HIGH_NIBBLE: Tuple[AddressType, ...] = tuple(
+    _VALID_ADDRESS_TYPE_BY_HIGH_NIBBLE.get(i, TYPE_INVALID) for i in range(16)
+)
 
 class Base32AddressMeta(type):
     """
@@ -119,6 +158,9 @@ class Base32Address(str, metaclass=Base32AddressMeta):
     ['user', 1, '0x1ECdE7223747601823f7535d7968Ba98b4881E09', 'CFXTEST:TYPE.USER:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE1RZ695J4', 'cfxtest:aat...95j4', '0x349f086998cF4a0C5a00b853a0E93239D81A97f6']
     """
     
+    # instances are plain str values without a __dict__, the decoded parts are cached by the class
+    __slots__ = ()
+
     _default_network_id: ClassVar[Optional[int]] = None
     default_network_id: ClassVar[Optional[int]]
     """
@@ -175,10 +217,21 @@ class Base32Address(str, metaclass=Base32AddressMeta):
             # if network_id is not specified (default),
             # # network_id will be cls.default_network_id, which defaults to None
             network_id = cls.default_network_id
-        # if the address is an instance of Base32Address, and network_id and verbose are not specified,
-        # return the address as a str ignoring validity check because it is already validated or allowed by _ignore_invalid_type
-        if isinstance(address, cls) and network_id is None and verbose is None:
-            return str.__new__(cls, str(address))
+        if isinstance(address, cls):
+            # if the address is an instance of Base32Address, and network_id and verbose are not specified,
+            # return the address as a str ignoring validity check because it is already validated or allowed by _ignore_invalid_type
+            if network_id is None and verbose is None:
+                return str.__new__(cls, str(address))
+            # if they are specified but already match the address, the address is also returned as is
+            # unless the address type is invalid and not allowed by _ignore_invalid_type, which encoding would reject
+            if verbose is None or verbose == address[0].isupper():
+                # the decoding of an instance is cached
+                decoded_network_id, _, address_type, _ = cls._decode_checked(address)
+                if (
+                    (network_id is None or network_id == decoded_network_id)
+                    and (_ignore_invalid_type or address_type != TYPE_INVALID)
+                ):
+                    return str.__new__(cls, str(address))
         # if _from_trust is True, 
         # it requires network_id is None and verbose is None
         # the new Base32Address will be initialized without validating, which means you can do
@@ -190,28 +243,31 @@ class Base32Address(str, metaclass=Base32AddressMeta):
             else:
                 raise ValueError("Invalid argument: `network_id` and `verbose` should be None if from_trusted_source is True")
         
-        try:
-            parts = cls.decode(address) # this line might raise exception if the address is not valid
+        if not isinstance(address, str):
+            raise InvalidAddress("Address should be either base32 or hex, "
+                            f"receives {address}")
+        # dispatch on the delimiter instead of trying to decode and falling back to hex on failure
+        if DELIMITER in address:
+            # raises InvalidBase32Address (a subclass of InvalidAddress) if the address is not valid
+            decoded_network_id, _, _, address_bytes = cls._decode_checked(address)
             if verbose is None:
                 # if verbose is None, the new address verbose is determined by the original address
                 verbose = (address[0] == "N" or address[0] == "C")
             if network_id is None:
                 # if network_id is None, the new address verbose is determined by the original address
-                network_id = parts["network_id"]
+                network_id = decoded_network_id
 
             validate_network_id(network_id)  
-            val = cls._encode(parts["hex_address"], network_id, verbose, _ignore_invalid_type=_ignore_invalid_type)
-        except InvalidBase32Address:
+            # the decoded bytes are encoded directly instead of parsing the checksum hex address again
+            val = cls._encode_address_bytes(address_bytes, network_id, verbose, _ignore_invalid_type)
+            return str.__new__(cls, val)
+        if is_hex_address_cached(address):
             if verbose is None:
                 verbose = False
-            if is_hex_address(address):
-                validate_network_id(network_id)
-                val = cls._encode(address, network_id, verbose, _ignore_invalid_type=_ignore_invalid_type) # type: ignore
-            else:
-                raise InvalidAddress("Address should be either base32 or hex, "
-                                f"receives {address}")
-        
-        return str.__new__(cls, val)
+            validate_network_id(network_id)
+            return str.__new__(cls, cls._encode(address, cast(int, network_id), verbose, _ignore_invalid_type=_ignore_invalid_type))
+        raise InvalidAddress("Address should be either base32 or hex, "
+                        f"receives {address}")
     
     def __eq__(self, _address: object) -> bool:
         """
@@ -226,7 +282,32 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         >>> assert "CFXTEST:TYPE.USER:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE1RZ695J4" == address
         >>> assert "cfxtest:aatp533cg7d0agbd87kz48nj1mpnkca8be1rz695j4" == address
         """
+        # identical strings always represent the same address, no need to decode
+        if self is _address or (isinstance(_address, str) and str.__eq__(self, _address)):
+            return True
+        if isinstance(_address, Base32Address):
+            # both addresses are validated, so they are equal iff their network prefixes and payloads match
+            self_lower = str.lower(self)
+            other_lower = str.lower(_address)
+            return (
+                self_lower[:self_lower.find(DELIMITER)] == other_lower[:other_lower.find(DELIMITER)]
+                and self_lower[self_lower.rfind(DELIMITER):] == other_lower[other_lower.rfind(DELIMITER):]
+            )
         try:
+            if isinstance(_address, str) and (_address.islower() or _address.isupper()):
+                # the network prefix and the payload (with checksum) determine an address,
+                # so matching them means equality without decoding _address
+                other_splits = _address.lower().split(DELIMITER)
+                self_splits = str.lower(self).split(DELIMITER)
+                if (
+                    other_splits[0] == self_splits[0] and other_splits[-1] == self_splits[-1]
+                    # the optional type field is still checked by decode unless it is the expected one
+                    and (
+                        len(other_splits) == 2
+                        or (len(other_splits) == 3 and other_splits[1] == _TYPE_FIELDS[self.address_type])
+                    )
+                ):
+                    return True
             parts = self.__class__.decode(_address) # type: ignore
             return self.hex_address == parts["hex_address"] and self.network_id == parts["network_id"]
         except:
@@ -235,8 +316,8 @@ class Base32Address(str, metaclass=Base32AddressMeta):
     def __ne__(self, _address: object) -> bool:
         return not (self == _address)
 
-    def __hash__(self) -> int:
-        return super().__hash__()
+    # use str hash directly to avoid an extra Python-level call
+    __hash__ = str.__hash__
 
     @classmethod
     def from_public_key(
@@ -259,7 +340,13 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         hex_address = public_key_to_cfx_hex(public_key)
         return cls(hex_address, network_id, verbose)
 
-    @cached_property
+    @property
+    def _parts(self) -> Base32AddressParts:
+        # network_id, hex_address and address_type share a single cached decoding pass,
+        # keyed on a plain str so the cache does not keep the instance and its class alive
+        return self._decode_parts(str(self))
+
+    @property
     def network_id(self) -> int:
         """
         :return int: network_id of the address
@@ -269,9 +356,9 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         >>> address.network_id
         1
         """        
-        return self.__class__._decode_network_id(self)
+        return self._parts["network_id"]
 
-    @cached_property
+    @property
     def hex_address(self) -> ChecksumAddress:
         """
         :return ChecksumAddress: hex address of the address, will be encoded in ethereum checksum format
@@ -280,9 +367,9 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         >>> address.hex_address
         '0x1ECdE7223747601823f7535d7968Ba98b4881E09'
         """        
-        return self.__class__._decode_hex_address(self)
+        return self._parts["hex_address"]
 
-    @cached_property
+    @property
     def address_type(self) -> AddressType:
         """
         :return Literal["null", "builtin", "user", "contract", "invalid"]: address type of an address. 
@@ -293,9 +380,9 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         >>> address.address_type
         'user'
         """      
-        return self.__class__._detect_address_type(HexBytes(self.hex_address))
+        return self._parts["address_type"]
 
-    @cached_property
+    @property
     def eth_checksum_address(self) -> ChecksumAddress:
         """
         :return ChecksumAddress: alias for :attr:`~hex_address`. This API will be deprecated in a future version
@@ -307,7 +394,7 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         warnings.warn("eth_checksum_address will be deprecated in a future version. use hex_address instead", DeprecationWarning)
         return self.hex_address
 
-    @cached_property
+    @property
     def verbose_address(self) -> "Base32Address":
         """
         :return Base32Address: self presented in verbose mode
@@ -318,7 +405,7 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         """        
         return self.encode_base32(self.hex_address, self.network_id, True)
     
-    @cached_property
+    @property
     def abbr(self) -> str:
         """
         :return str: abbreviation of the address, as mentioned in https://forum.conflux.fun/t/voting-results-for-new-address-abbreviation-standard/7131
@@ -332,7 +419,7 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         """        
         return self.__class__._shorten_base32_address(self)
     
-    @cached_property
+    @property
     def compressed_abbr(self) -> str:
         """
         :return str: compressed abbreviation of the address, as mentioned in https://forum.conflux.fun/t/voting-results-for-new-address-abbreviation-standard/7131
@@ -347,7 +434,7 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         """ 
         return self.__class__._shorten_base32_address(self, True)
     
-    @cached_property
+    @property
     def mapped_evm_space_address(self) -> ChecksumAddress:
         """
         :return ChecksumAddress: the address of mapped account for EVM space as defined in https://github.com/Conflux-Chain/CIPs/blob/master/CIPs/cip-90.md#mapped-account
@@ -388,41 +475,31 @@ class Base32Address(str, metaclass=Base32AddressMeta):
     def _encode(
         cls, hex_address: str, network_id: int, verbose: bool, *, _ignore_invalid_type: bool=False
     ) -> str:
-        network_prefix = cls._encode_network_prefix(network_id)
-        address_bytes = HexBytes(hex_address)
-        payload = base32.encode(VERSION_BYTE + address_bytes)
-        checksum = cls._create_checksum(network_prefix, payload)
-        parts = [network_prefix]
-        address_type = cls._detect_address_type(address_bytes)
-        if address_type == TYPE_INVALID and not _ignore_invalid_type:
-            raise InvalidConfluxHexAddress(f"The hex address should start with 0x0, 0x1 or 0x8, received {hex_address}."
+        # the cache is keyed by the address bytes,
+        # so hex addresses differing only in case share one cache entry
+        return cls._encode_address_bytes(hex_address_bytes(hex_address), network_id, verbose, _ignore_invalid_type)
+
+    # the lru caches are kept on static methods so cls is not part of the cache key,
+    # otherwise every class created by get_base32_address_factory would get its own entries and be kept alive by the cache
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _encode_address_bytes(
+        address_bytes: bytes, network_id: int, verbose: bool, _ignore_invalid_type: bool
+    ) -> str:
+        # an invalid type only depends on the high nibble, so the type is fully detected only for the verbose type field.
+        # the type is checked before encoding so invalid addresses fail early
+        if not _ignore_invalid_type and _ADDRESS_TYPE_BY_HIGH_NIBBLE[address_bytes[0] >> 4] == TYPE_INVALID:
+            raise InvalidConfluxHexAddress(f"The hex address should start with 0x0, 0x1 or 0x8, received {HEX_PREFIX}{address_bytes.hex()}."
                                         "Check your code logic or set _ignore_invalid_type=True")
+        network_prefix = Base32Address._encode_network_prefix(network_id)
+        payload = base32.encode(VERSION_BYTE + address_bytes)
+        checksum = Base32Address._create_checksum(network_prefix, payload)
+        # each part is formatted in the target case directly instead of joining and upper-casing the whole address
         if verbose:
-            parts.append(f"{TYPE}.{address_type}")
-        parts.append(payload + checksum)
-        address = DELIMITER.join(parts)
-        if verbose:
-            return address.upper()
-        return address
-
-    @classmethod
-    def _decode_network_id(cls, base32_address: str) -> int:
-        base32_address = base32_address.lower()
-        parts = base32_address.split(DELIMITER)
-        return cls._network_prefix_to_id(parts[0])
-
-    @classmethod
-    def _decode_hex_address(cls, base32_address: str) -> ChecksumAddress:
-        base32_address = base32_address.lower()
-        parts = base32_address.split(DELIMITER)
-        return cls._payload_to_hex(parts[-1])
+            address_type = Base32Address._detect_address_type(address_bytes)
+            return f"{network_prefix.upper()}{DELIMITER}{TYPE.upper()}.{address_type.upper()}{DELIMITER}{(payload + checksum).upper()}"
+        return f"{network_prefix}{DELIMITER}{payload}{checksum}"
 
-    @classmethod
-    def _payload_to_hex(cls, payload: str) -> ChecksumAddress:
-        address_buf = base32.decode(payload)
-        hex_buf = address_buf[1:21]
-        return to_checksum_address(HEX_PREFIX + hex_buf.hex()) # type: ignore
-    
     @classmethod
     def decode(cls, base32_address: str) -> Base32AddressParts:
         """
@@ -437,62 +514,33 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         >>> Base32Address.decode("cfxtest:aatp533cg7d0agbd87kz48nj1mpnkca8be1rz695j4")
         {'network_id': 1, 'hex_address': '0x1ECdE7223747601823f7535d7968Ba98b4881E09', 'address_type': 'user'}
         """        
+        network_id, hex_address, address_type, _ = cls._decode_checked(base32_address)
+        # a fresh dict is returned every call so the cached result can not be modified by callers
+        return {
+            "network_id": network_id,
+            "hex_address": hex_address,
+            "address_type": address_type
+        }
+
+    @classmethod
+    def _decode_checked(cls, base32_address: str) -> Tuple[int, ChecksumAddress, AddressType, bytes]:
+        """
+        Validate and decode a base32 address of any case.
+        Besides the decoded parts, the 20 address bytes are returned so callers need not parse the hex address again
+        """
         try:
             if not isinstance(base32_address, str):
                 raise InvalidBase32Address(f"Receives an argument of type {type(base32_address)}, expected a string")
-            if not any([
-                str(base32_address) == base32_address.upper(), 
-                str(base32_address) == base32_address.lower(), 
-            ]):
+            # isupper and islower scan the string once without building upper and lower case copies,
+            # and the address only needs lowering if it is in upper case
+            if base32_address.isupper():
+                base32_address = base32_address.lower()
+            elif not base32_address.islower():
                 raise InvalidBase32Address("Base32 address is supposed to be composed of all uppercase or lower case, "
                                         f"Receives {base32_address}")
-            
-            base32_address = base32_address.lower()
 
-            splits = base32_address.split(DELIMITER)
-            if len(splits) != 2 and len(splits) != 3:
-                raise InvalidBase32Address(
-                    "Address needs to be encode in Base32 format, such as cfx:aaejuaaaaaaaaaaaaaaaaaaaaaaaaaaaajrwuc9jnb. "
-                    "Received: {}".format(base32_address))
-
-            # if exception occurs, outer try-except will handle
-            address_parts = cls._decode(base32_address)
-
-            # check address type
-            address_type = address_parts["address_type"]
-            # it is ok to decode an address whose type is invalid
-            # if address_type == TYPE_INVALID:
-            #     raise InvalidBase32Address(f"Invalid address type: the hex address of the provided address is {address_parts['hex_address']}, "
-            #                             "while valid conflux address is supposed to start with 0x0, 0x1 or 0x8")
-            
-            """
-            cip-37 #Decoding
-            6.Verify optional fields:
-
-            If the optional fields contain type.*: Verify the address-type according to the specification above.
-            Unknown options (options other than type.*) should be ignored.
-            
-            which means
-            if address field is not expected, reject if the address field is a known one, else ignore
-            e.g.
-            valid CFX:TYPE.USER:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE7GGP3VPU
-            invalid CFX:TYPE.NULL:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE7GGP3VPU
-            ignore(but valid) CFX:GOD:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE7GGP3VPU
-            """
-            if len(splits) == 3 and splits[1] != f"{TYPE}.{address_type}":
-                address_field = splits[1]
-                if address_field.startswith(f"{TYPE}.") and address_field[5:] in get_args(AddressType):
-                    raise InvalidBase32Address(f"Invalid address type field: the address type field does not match expected, "
-                                            f"expected {TYPE}.{address_type} but receives {address_field}, which is a known address type")
-            
-            # check checksum
-            hex_address = address_parts["hex_address"]
-            address_bytes = HexBytes(hex_address)
-            payload = base32.encode(VERSION_BYTE + address_bytes)
-            checksum = cls._create_checksum(splits[0], payload)
-            if checksum != base32_address[-8:]:
-                raise InvalidBase32Address(f"Invalid Base32 address: checksum verification failed")
-            return address_parts
+            # the cache is keyed on a plain str rather than a possible Base32Address instance
+            return cls._decode_validated(str(base32_address))
         except Exception as e:
             if isinstance(e, InvalidBase32Address):
                 raise e
@@ -502,21 +550,98 @@ class Base32Address(str, metaclass=Base32AddressMeta):
                     "Address needs to be a Base32 format string, such as cfx:aaejuaaaaaaaaaaaaaaaaaaaaaaaaaaaajrwuc9jnb\n"
                     f"Received argument {base32_address} of type {type(base32_address)}")
         
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _decode_validated(base32_address: str) -> Tuple[int, ChecksumAddress, AddressType, bytes]:
+        """
+        Decode and validate a lower case base32 address.
+        The result is cached as the same addresses are usually decoded repeatedly,
+        exceptions (invalid addresses) are not cached
+        """
+        splits = base32_address.split(DELIMITER)
+        if len(splits) != 2 and len(splits) != 3:
+            raise InvalidBase32Address(
+                "Address needs to be encode in Base32 format, such as cfx:aaejuaaaaaaaaaaaaaaaaaaaaaaaaaaaajrwuc9jnb. "
+                "Received: {}".format(base32_address))
+
+        # if exception occurs, the try-except in decode will handle
+        network_id = Base32Address._network_prefix_to_id(splits[0], _assume_lower=True)
+        address_bytes = Base32Address._decode_address_bytes(splits[-1])
+
+        # check address type
+        address_type = Base32Address._detect_address_type(address_bytes)
+        # it is ok to decode an address whose type is invalid
+        # if address_type == TYPE_INVALID:
+        #     raise InvalidBase32Address(f"Invalid address type: the hex address of the provided address is {address_parts['hex_address']}, "
+        #                             "while valid conflux address is supposed to start with 0x0, 0x1 or 0x8")
+        
+        """
+        cip-37 #Decoding
+        6.Verify optional fields:
+
+        If the optional fields contain type.*: Verify the address-type according to the specification above.
+        Unknown options (options other than type.*) should be ignored.
+        
+        which means
+        if address field is not expected, reject if the address field is a known one, else ignore
+        e.g.
+        valid CFX:TYPE.USER:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE7GGP3VPU
+        invalid CFX:TYPE.NULL:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE7GGP3VPU
+        ignore(but valid) CFX:GOD:AATP533CG7D0AGBD87KZ48NJ1MPNKCA8BE7GGP3VPU
+        """
+        if len(splits) == 3 and splits[1] != _TYPE_FIELDS[address_type]:
+            address_field = splits[1]
+            if address_field.startswith(f"{TYPE}.") and address_field[5:] in _ADDRESS_TYPES:
+                raise InvalidBase32Address(f"Invalid address type field: the address type field does not match expected, "
+                                        f"expected {TYPE}.{address_type} but receives {address_field}, which is a known address type")
+        
+        # check checksum against the received payload instead of re-encoding the decoded hex address
+        address_words = base32.decode_to_words(splits[-1])
+        payload_words = address_words[:-8]
+        # decoding the hex address ignores the version byte and padding bits,
+        # so check the payload is the canonical encoding of VERSION_BYTE + 20 bytes hex address:
+        # 34 words, of which the first 8 bits (version byte) and the last 2 bits (padding) are zero
+        if len(payload_words) != 34 or payload_words[0] or payload_words[1] >> 2 or payload_words[-1] & 0x03:
+            raise InvalidBase32Address(f"Invalid Base32 address: unexpected payload {splits[-1][:-8]}")
+        # the checksum is valid iff poly_mod over the prefix, payload and received checksum words is 0,
+        # so there is no need to compute and encode the expected checksum
+        if Base32Address._prefixed_poly_mod(splits[0], address_words):
+            raise InvalidBase32Address(f"Invalid Base32 address: checksum verification failed")
+        return network_id, to_checksum_address(address_bytes), address_type, address_bytes
+
     @classmethod
     def _decode(cls, base32_address: str) -> Base32AddressParts:
         """ 
-        do not validate unless necessary, used if validity is known
+        do not validate unless necessary, used if validity is known.
+        base32_address is expected to be lower case
         """
         parts = base32_address.split(DELIMITER)
-        network_id = cls._network_prefix_to_id(parts[0])
-        hex_address = cls._payload_to_hex(parts[-1])
-        address_type = cls._detect_address_type(HexBytes(hex_address))
+        network_id = cls._network_prefix_to_id(parts[0], _assume_lower=True)
+        address_bytes = cls._decode_address_bytes(parts[-1])
         return {
             "network_id": network_id,
-            "hex_address": hex_address,
-            "address_type": address_type
+            "hex_address": to_checksum_address(address_bytes),
+            # the address type is detected from the decoded bytes rather than parsing the hex address again
+            "address_type": cls._detect_address_type(address_bytes)
         }
 
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _decode_parts(base32_address: str) -> Base32AddressParts:
+        """ 
+        cached :meth:`~_decode` of a Base32Address in any case.
+        Instances have no __dict__ to store the decoded parts, so they are cached here.
+        The returned dict is shared and should not be modified
+        """
+        return Base32Address._decode(base32_address.lower())
+
+    @classmethod
+    def _decode_address_bytes(cls, payload: str) -> bytes:
+        """
+        the 20 address bytes of a lower case payload, skipping the version byte
+        """
+        return base32.decode(payload)[1:21]
+
     @classmethod
     def is_valid_base32(cls, value: Any) -> bool:
         """
@@ -525,7 +650,8 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         :return bool: True if valid, else False
         """        
         try:
-            cls.decode(value)
+            # the parts dict built by decode is not needed here
+            cls._decode_checked(value)
             return True
         except:
             return False
@@ -539,8 +665,9 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         :raises InvalidBase32Address: raises an exception if the address is not a valid base32 address
         :return Literal[True]: returns True only if address is valid
         """
+        # instances created with _from_trust are not validated, so instances are checked as well.
         # an exception will be raised if decode failure
-        cls.decode(value)
+        cls._decode_checked(value)
         return True
   
     @classmethod
@@ -571,7 +698,13 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         """        
         if network_id is default:
             network_id = cast(int, cls.default_network_id)
-        return cls.encode_base32("0x0000000000000000000000000000000000000000", network_id, verbose)
+        validate_network_id(network_id)
+        # the zero address of a network never changes, so it is only encoded once
+        key = (network_id, verbose)
+        zero_address = _ZERO_ADDRESS_CACHE.get(key)
+        if zero_address is None:
+            zero_address = _ZERO_ADDRESS_CACHE[key] = cls.encode_base32("0x0000000000000000000000000000000000000000", network_id, verbose)
+        return cls(zero_address, None, _from_trust=True)
     
     @classmethod
     def shorten_base32_address(cls, base32_address: str, compressed: bool=False) -> str:
@@ -617,15 +750,18 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         hex_address = cls.decode(base32_address)["hex_address"]
         return cls._mapped_evm_address_from_hex(hex_address)
 
-    @classmethod
-    def _mapped_evm_address_from_hex(cls, hex_address: str) -> ChecksumAddress:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _mapped_evm_address_from_hex(hex_address: str) -> ChecksumAddress:
         # do not check hex_address validity here
-        mapped_hash = keccak(HexBytes(hex_address)).hex()
-        mapped_evm_space_address = to_checksum_address(HEX_PREFIX + mapped_hash[-40:])
-        return mapped_evm_space_address
-
-    @classmethod
-    def _encode_network_prefix(cls, network_id: int) -> NetworkPrefix:
+        # callers pass checksum addresses, so the same address always hits the same cache entry
+        mapped_hash = keccak(hex_address_bytes(hex_address))
+        # the last 20 bytes of the digest are checksummed directly instead of slicing its hex string
+        return to_checksum_address(mapped_hash[-20:])
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _encode_network_prefix(network_id: int) -> NetworkPrefix:
         if network_id == MAINNET_NETWORK_ID:
             return MAINNET_PREFIX
         elif network_id == TESTNET_NETWORK_ID:
@@ -633,9 +769,11 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         else:
             return COMMON_NET_PREFIX + str(network_id)
 
-    @classmethod
-    def _network_prefix_to_id(cls, network_prefix: NetworkPrefix) -> int:
-        network_prefix = network_prefix.lower()
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _network_prefix_to_id(network_prefix: NetworkPrefix, *, _assume_lower: bool = False) -> int:
+        if not _assume_lower:
+            network_prefix = network_prefix.lower()
         if network_prefix == MAINNET_PREFIX:
             return MAINNET_NETWORK_ID
         elif network_prefix == TESTNET_PREFIX:
@@ -656,63 +794,65 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         :param payload: bytes
         :return: string
         """
-        delimiter = VERSION_BYTE
-        template = CHECKSUM_TEMPLATE
-        mod = cls._poly_mod(cls._prefix_to_words(prefix) + delimiter + base32.decode_to_words(payload) + template)
-        return base32.encode(cls._checksum_to_bytes(mod))
+        return cls._create_checksum_from_words(prefix, base32.decode_to_words(payload))
 
     @classmethod
-    def _detect_address_type(cls, hex_address_buf: bytes) -> AddressType:
-        if hex_address_buf == bytes(20):
-            return TYPE_NULL
-        first_byte = hex_address_buf[0] & 0xf0
-        if first_byte == 0x00:
-            return TYPE_BUILTIN
-        elif first_byte == 0x10:
-            return TYPE_USER
-        elif first_byte == 0x80:
-            return TYPE_CONTRACT
-        else:
-            return TYPE_INVALID
+    def _create_checksum_from_words(cls, prefix: NetworkPrefix, payload_words: bytearray) -> str:
+        mod = cls._prefixed_poly_mod(prefix, payload_words, len(CHECKSUM_TEMPLATE))
+        # the checksum is the 40-bit big-endian representation of mod
+        return base32.encode(mod.to_bytes(5, "big"))
 
     @classmethod
-    def _prefix_to_words(cls, prefix: NetworkPrefix) -> bytearray:
-        words = bytearray()
-        for v in bytes(prefix, 'ascii'):
-            words.append(v & 0x1f)
-        return words
+    def _prefixed_poly_mod(cls, prefix: NetworkPrefix, words: bytearray, template_length: int = 0) -> int:
+        """
+        poly_mod of prefix words + delimiter + words + template
+        """
+        # the state after the prefix and the delimiter only depends on the prefix,
+        # so the prefix words are not processed again for each address
+        state = cls._prefix_poly_mod_state(prefix)
+        if template_length:
+            # the template (CHECKSUM_TEMPLATE) is zero words, which a new buffer starts with
+            buf = bytearray(len(words) + template_length)
+            buf[:len(words)] = words
+            words = buf
+        return cls._poly_mod(words, state)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _prefix_poly_mod_state(prefix: NetworkPrefix) -> int:
+        # _poly_mod xors the final state with 1, which is undone to continue from this state
+        return Base32Address._poly_mod(Base32Address._prefix_to_words(prefix) + VERSION_BYTE) ^ 1
 
     @classmethod
-    def _checksum_to_bytes(cls, data: int) -> bytearray:
-        result = bytearray(0)
-        result.append((data >> 32) & 0xff)
-        result.append((data >> 24) & 0xff)
-        result.append((data >> 16) & 0xff)
-        result.append((data >> 8) & 0xff)
-        result.append((data) & 0xff)
-        return result
+    def _detect_address_type(cls, hex_address_buf: bytes) -> AddressType:
+        first_byte = hex_address_buf[0]
+        # the null address check is only needed when the first byte is zero
+        if not first_byte and not int.from_bytes(hex_address_buf, "big"):
+            return TYPE_NULL
+        return _ADDRESS_TYPE_BY_HIGH_NIBBLE[first_byte >> 4]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _prefix_to_words(prefix: NetworkPrefix) -> bytes:
+        # only a few prefixes are used in practice,
+        # the result is immutable bytes so the cached value can be shared safely
+        return bytes(prefix, 'ascii').translate(_LOW_5_BITS_TABLE)
 
     @classmethod
-    def _poly_mod(cls, v: Union[bytes, bytearray]) -> int:
+    def _poly_mod(cls, v: Union[bytes, bytearray], c: int = 1) -> int:
         """
-        :param v: bytes
+        :param v: bytes or bytearray of 5-bit words, which is built by the caller so is not type checked here
+        :param c: initial state, defaults to 1. Used to continue from the state after a known prefix
         :return: int64
         """
-        assert type(v) == bytes or type(v) == bytearray
-        c = 1
-        for d in v:
-            c0 = c >> 35
-            c = ((c & 0x07ffffffff) << 5) ^ d
-            if c0 & 0x01:
-                c ^= 0x98f2bc8e61
-            if c0 & 0x02:
-                c ^= 0x79b76d99e2
-            if c0 & 0x04:
-                c ^= 0xf33e5fb3c4
-            if c0 & 0x08:
-                c ^= 0xae2eabe2a8
-            if c0 & 0x10:
-                c ^= 0x1e4f43e470
+        # bind the table to a local so the loop body avoids a global lookup per iteration
+        table = _POLY_MOD_PAIR_TABLE
+        # two words are consumed per iteration
+        words = iter(v)
+        for d1, d2 in zip(words, words):
+            c = ((c & 0x3fffffff) << 10) ^ (d1 << 5) ^ d2 ^ table[c >> 30]
+        if len(v) & 1:
+            c = ((c & 0x07ffffffff) << 5) ^ v[-1] ^ _POLY_MOD_TABLE[c >> 35]
 
         return c ^ 1
     
@@ -726,7 +866,7 @@ class Base32Address(str, metaclass=Base32AddressMeta):
         def custom_handler(value: Any):
             if isinstance(value, Base32Address):
                 return value
-            address_type = cls.decode(value)["address_type"]
+            address_type = cls._decode_checked(value)[2]
             if address_type == TYPE_INVALID:
                 raise ValueError(f"Invalid address type: {address_type}, please convert responding address to Base32Address using Base32Address(address, _ignore_invalid_type=True)")
             return cls(value)
@@ -746,10 +886,12 @@ def get_base32_address_factory(default_network_id: int) -> Type[Base32Address]:
     :param int default_network_id: default network 
     :return Type[Base32Address]: a Class object of Base32Address with default_network_id
     """
+    # a new class is created per call, as the default_network_id of a returned class can be changed by its holder
     return type(
         "Base32Address",
         (Base32Address,),
         {
+            "__slots__": (),
             "_default_network_id": default_network_id
         }
     )
@@ -9,7 +9,9 @@ PADDING_LETTER = '='
 
 
 def encode(buffer: Union[bytes, bytearray]) -> str:
-    assert type(buffer) == bytes or type(buffer) == bytearray, "please pass an bytes"
+    if not isinstance(buffer, (bytes, bytearray)):
+        raise TypeError(f"Invalid argument type: base32 encode requires a bytes or bytearray argument "
+                        f"but receives an argument of type {type(buffer)}")
     b32encoded = base64.b32encode(buffer)  # encode bytes
     b32str = b32encoded.decode().replace(PADDING_LETTER, "")  # translate chars
     return b32str.translate(ENCODE_TRANS)  # remove padding char
@@ -31,15 +33,25 @@ def decode(b32str: str) -> bytes:
     return base64.b32decode(b32str.translate(DECODE_TRANS))
 
 
+# tables to convert between base32 characters and 5-bit words with bytes.translate,
+# characters out of the alphabet are mapped to INVALID_WORD
+INVALID_WORD = 0xff
+WORDS_DECODE_TABLE = bytes(
+    CUSTOM_ALPHABET.find(chr(i)) if chr(i) in CUSTOM_ALPHABET else INVALID_WORD for i in range(256)
+)
+WORDS_ENCODE_TABLE = CUSTOM_ALPHABET.encode("ascii") + bytes(256 - len(CUSTOM_ALPHABET))
+
+
 def decode_to_words(b32str: str) -> bytearray:
-    result = bytearray()
-    for c in b32str:
-        result.append(CUSTOM_ALPHABET.index(c))
+    # translate runs in C rather than looking up each character in a Python loop
+    result = bytearray(b32str.encode("ascii").translate(WORDS_DECODE_TABLE))
+    if INVALID_WORD in result:
+        raise ValueError(f"Invalid value: {b32str} contains characters out of the base32 alphabet")
     return result
 
 
 def encode_words(words: Iterable[int]) -> str:
-    result = ""
-    for v in words:
-        result += CUSTOM_ALPHABET[v]
-    return result
+    buffer = bytes(words)
+    if buffer and max(buffer) >= len(CUSTOM_ALPHABET):
+        raise ValueError(f"Invalid value: words should be less than {len(CUSTOM_ALPHABET)}")
+    return buffer.translate(WORDS_ENCODE_TABLE).decode("ascii")
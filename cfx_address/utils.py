@@ -13,6 +13,7 @@ from eth_utils.address import (
 )
 
 from cfx_address._utils import (
+    hex_address_bytes,
     validate_hex_address,
     validate_network_id,
     eth_eoa_address_to_cfx_hex,
@@ -112,6 +113,7 @@ def validate_address_agaist_network_id(
 
 
 __all__ = [
+    "hex_address_bytes",
     "validate_hex_address",
     "validate_network_id",
     "eth_eoa_address_to_cfx_hex",
@@ -78,10 +78,10 @@ setup(
     package_data={'cfx_address': ['py.typed']},
     install_requires=[
         "eth-utils>=1.9.5",
+        "eth-hash>=0.3.1",
         "hexbytes",
         "cfx-utils>=1.0.2",
         "typing_extensions",
-        "cached_property==1.5.2;python_version<'3.8'",
         "pydantic>=2.0.0,<3"
     ],  # add any additional packages that
     # needs to be installed along with your package. Eg: 'caer'
@@ -1,3 +1,6 @@
+import gc
+import random
+import weakref
 import pytest
 from cfx_address.address import (
     Base32Address,
@@ -57,6 +60,11 @@ def test_validation():
     assert not Base32Address.is_valid_base32(invalid_type_address)
     assert not Base32Address.is_valid_base32(mixed_testnet_address)
     assert Base32Address.is_valid_base32(unknown_type_address)
+    assert Base32Address.is_valid_base32(Base32Address(testnet_address))
+    # instances created with _from_trust are not trusted by the validators
+    assert not Base32Address.is_valid_base32(Base32Address("hello world", _from_trust=True))
+    with pytest.raises(InvalidBase32Address):
+        Base32Address.validate(Base32Address("hello world", _from_trust=True))
     for invalid in invalids:
         assert not Base32Address.is_valid_base32(invalid)
     
@@ -84,6 +92,15 @@ def test_equals_and_ne():
     assert not testnet_address != Base32Address(testnet_verbose_address)
     assert not Base32Address(testnet_verbose_address) != testnet_address
     assert Base32Address(testnet_address) != object()
+    assert Base32Address(mainnet_address) == mainnet_verbose_address.lower()
+    assert Base32Address(mainnet_address) == unknown_type_address
+    assert Base32Address(mainnet_address) != invalid_type_address
+    assert Base32Address(testnet_address) != mixed_testnet_address
+    assert Base32Address(testnet_address) != "cfxtest:type.user:type.user:aatp533cg7d0agbd87kz48nj1mpnkca8be1rz695j4"
+    assert Base32Address(testnet_address) == Base32Address(testnet_verbose_address)
+    assert Base32Address(mainnet_verbose_address) == Base32Address(unknown_type_address)
+    assert Base32Address(testnet_address) != Base32Address(mainnet_address)
+    assert Base32Address(testnet_address) != Base32Address.zero_address(1)
 
 def test_zero_address():
     assert str(Base32Address.zero_address(1)) == "cfxtest:aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa6f0vrcsw"
@@ -92,6 +109,9 @@ def test_zero_address():
 def test_util():
     assert Base32Address.calculate_mapped_evm_space_address(testnet_address) == mapped_evm_space_address
     assert Base32Address.shorten_base32_address(testnet_address) == shortened_testnet_address
+    assert Base32Address.shorten_base32_address(Base32Address(testnet_address)) == shortened_testnet_address
+    with pytest.raises(InvalidBase32Address):
+        Base32Address.shorten_base32_address(testnet_address[:-1] + "5")
 
 def test_decode():
     assert Base32Address.decode(mainnet_address)["hex_address"] == hex_address
@@ -103,6 +123,31 @@ def test_decode():
         with pytest.raises(InvalidBase32Address):
             Base32Address.decode(invalid)
 
+def test_decode_wrong_checksum():
+    # payload of the mainnet address with testnet prefix
+    with pytest.raises(InvalidBase32Address):
+        Base32Address.decode("cfxtest:" + mainnet_address.split(":")[1])
+    with pytest.raises(InvalidBase32Address):
+        Base32Address.decode(testnet_address[:-1] + "5")
+
+def test_decode_non_canonical_payload():
+    payload = testnet_address.split(":")[1][:-8]
+    # nonzero padding bits
+    padded_payload = payload[:-1] + "f"
+    # nonzero version byte
+    versioned_payload = "b" + payload[1:]
+    for non_canonical in [padded_payload, versioned_payload]:
+        address = f"cfxtest:{non_canonical}{Base32Address._create_checksum('cfxtest', non_canonical)}" # pyright: ignore[reportPrivateUsage]
+        with pytest.raises(InvalidBase32Address):
+            Base32Address.decode(address)
+        # the checksum of the canonical payload does not make a non-canonical payload valid
+        address = f"cfxtest:{non_canonical}{testnet_address[-8:]}"
+        with pytest.raises(InvalidBase32Address):
+            Base32Address.decode(address)
+        assert Base32Address(testnet_address) != address
+        with pytest.raises(InvalidBase32Address):
+            Base32Address(address)
+
 def test_instance():
     instance = Base32Address(testnet_address)
     assert instance.network_id == 1
@@ -148,6 +193,25 @@ def test_init_with_none_verbose():
     instance = Base32Address(mainnet_verbose_address, network_id=1, verbose=None)
     assert str(instance) == str(testnet_verbose_address), "verbose should be preserved!"
 
+def test_init_from_instance():
+    instance = Base32Address(testnet_address)
+    assert str(Base32Address(instance, 1)) == testnet_address
+    assert str(Base32Address(instance, 1, False)) == testnet_address
+    assert str(Base32Address(instance, 1, True)) == testnet_verbose_address
+    assert str(Base32Address(instance, 1029)) == mainnet_address
+    verbose_instance = Base32Address(testnet_verbose_address)
+    assert str(Base32Address(verbose_instance, 1, True)) == testnet_verbose_address
+    assert str(Base32Address(verbose_instance, 1, False)) == testnet_address
+    # an instance of invalid type is only passed through if allowed by _ignore_invalid_type
+    invalid_instance = Base32Address(invalid_hex_address, 1, _ignore_invalid_type=True)
+    assert Base32Address(invalid_instance) == invalid_instance
+    assert Base32Address(invalid_instance, 1, _ignore_invalid_type=True) == invalid_instance
+    with pytest.raises(InvalidConfluxHexAddress):
+        Base32Address(invalid_instance, 1)
+    testnet_factory = get_base32_address_factory(1)
+    with pytest.raises(InvalidConfluxHexAddress):
+        testnet_factory(testnet_factory(invalid_hex_address, _ignore_invalid_type=True))
+
 def test_init_from_invalid_type():
     with pytest.raises(InvalidConfluxHexAddress):
         instance = Base32Address(invalid_hex_address, 1)
@@ -170,6 +234,7 @@ def test_init_from_invalid_base32_address():
 def test_init_from_public_key():
     instance = Base32Address.from_public_key(pk, 1)
     assert instance == Base32Address(pk_address, 1)
+    assert Base32Address.from_public_key(bytes.fromhex(pk[2:]), 1) == instance
 
 def test_with_default_network_id():
     Base32Address.default_network_id = 1
@@ -187,3 +252,55 @@ def test_base32_address_factory():
     assert mainnet_factory(hex_address) == mainnet_address
     with pytest.raises(InvalidNetworkId):
         testnet_factory.default_network_id = "3123123" # type: ignore
+    # changing the default_network_id of a factory does not affect other factories
+    another_testnet_factory = get_base32_address_factory(1)
+    testnet_factory.default_network_id = 1029
+    assert str(testnet_factory(hex_address)) == mainnet_address
+    assert str(another_testnet_factory(hex_address)) == testnet_address
+    assert str(get_base32_address_factory(1)(hex_address)) == testnet_address
+    # instances do not carry a __dict__
+    assert not hasattr(testnet_factory(hex_address), "__dict__")
+    assert not hasattr(Base32Address(testnet_address), "__dict__")
+
+def test_base32_address_factory_not_kept_alive():
+    factory = get_base32_address_factory(1)
+    address = factory(hex_address)
+    assert factory(address).network_id == 1
+    assert address.mapped_evm_space_address == mapped_evm_space_address
+    assert factory(address.upper(), verbose=True).address_type == "user"
+    factory_ref = weakref.ref(factory)
+    del factory, address
+    gc.collect()
+    # the decoding and encoding caches should not keep factory classes alive
+    assert factory_ref() is None
+
+def test_encode_cache_keeps_type_check():
+    assert Base32Address.encode_base32(hex_address.lower(), 1) == Base32Address.encode_base32(hex_address.upper().replace("0X", "0x"), 1)
+    Base32Address.encode_base32(invalid_hex_address, 1, _ignore_invalid_type=True)
+    # a cached encoding allowed by _ignore_invalid_type should not bypass the type check
+    with pytest.raises(InvalidConfluxHexAddress):
+        Base32Address.encode_base32(invalid_hex_address, 1)
+
+def _reference_poly_mod(v: bytes) -> int:
+    # the reduction as written in CIP-37
+    c = 1
+    for d in v:
+        c0 = c >> 35
+        c = ((c & 0x07ffffffff) << 5) ^ d
+        if c0 & 0x01:
+            c ^= 0x98f2bc8e61
+        if c0 & 0x02:
+            c ^= 0x79b76d99e2
+        if c0 & 0x04:
+            c ^= 0xf33e5fb3c4
+        if c0 & 0x08:
+            c ^= 0xae2eabe2a8
+        if c0 & 0x10:
+            c ^= 0x1e4f43e470
+    return c ^ 1
+
+def test_poly_mod_matches_reference():
+    rng = random.Random(0)
+    for length in range(0, 80):
+        words = bytes(rng.randrange(32) for _ in range(length))
+        assert Base32Address._poly_mod(words) == _reference_poly_mod(words) # pyright: ignore[reportPrivateUsage]
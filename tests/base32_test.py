@@ -1,3 +1,4 @@
+import pytest
 from cfx_address import base32
 
 hex_address = '02e1a5817abf2812f04c744927fc91f03099c0f4'
@@ -6,7 +7,19 @@ base32_address = 'anu4nan416ybf6cpsvewt9ev8a2kxuhy'
 def test_encode():
   assert base32.encode(bytes.fromhex(hex_address)) == base32_address
   assert base32.encode("hello world".encode("utf-8")) == "rbw025dteb5086xppu"
+  assert base32.encode(bytearray(b"hello world")) == "rbw025dteb5086xppu"
+  with pytest.raises(TypeError):
+    base32.encode("hello world") # type: ignore
 
 def test_decode():
   assert base32.decode("rbw025dteb5086xppu").decode() == "hello world"
-  assert base32.decode(base32_address).hex() == hex_address
\ No newline at end of file
+  assert base32.decode(base32_address).hex() == hex_address
+
+def test_words():
+  words = base32.decode_to_words(base32_address)
+  assert list(words) == [base32.CUSTOM_ALPHABET.index(c) for c in base32_address]
+  assert base32.encode_words(words) == base32_address
+  with pytest.raises(ValueError):
+    base32.decode_to_words("anu4nan416ybf6cpsvewt9ev8a2kxuhi")
+  with pytest.raises(ValueError):
+    base32.encode_words([32])
@@ -2,6 +2,8 @@ import pytest
 from cfx_address.utils import (
     eth_eoa_address_to_cfx_hex,
     normalize_to,
+    validate_hex_address,
+    validate_network_id,
     validate_address_agaist_network_id
     # is_valid_address,
 )
@@ -10,6 +12,8 @@ from cfx_address import (
 )
 from cfx_utils.exceptions import (
     AddressNotMatch,
+    InvalidHexAddress,
+    InvalidNetworkId,
     Base32AddressNotMatch
 )
 
@@ -29,6 +33,21 @@ mainnet_address = "cfx:aatp533cg7d0agbd87kz48nj1mpnkca8be7ggp3vpu"
 def test_eoa_address_convert():
     assert eth_eoa_address_to_cfx_hex(eoa_address) == converted_address
 
+def test_validate_hex_address():
+    assert validate_hex_address(hex_address)
+    # validated again to exercise the cached result
+    assert validate_hex_address(hex_address)
+    for invalid in ["0x0", mainnet_address, 114514, [hex_address]]:
+        with pytest.raises(InvalidHexAddress):
+            validate_hex_address(invalid)
+
+def test_validate_network_id():
+    assert validate_network_id(1)
+    assert validate_network_id(1029)
+    for invalid in [0, -1, True, 1.0, "1", None]:
+        with pytest.raises(InvalidNetworkId):
+            validate_network_id(invalid)
+
 def test_normalize():
     assert normalize_to(testnet_verbose_address, None) == hex_address
     assert normalize_to(testnet_verbose_address, 1029) == mainnet_address